@@ -12,14 +12,21 @@ Project Scanner for Code Files with Token Calculation
 * Output formats:
     - JSON for structured data
     - Plain text as a backward-compatible option
+* --stats-only reports the token statistics from file sizes without reading any file
 """
 from __future__ import annotations
 import os
 import sys
 import json
+import hashlib
+import shutil
+import argparse
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
-from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -33,19 +40,21 @@ SKIP_DIRS = {
 }
 
 # Define file types to include (excluding Python as requested)
-INCLUDE_EXTS = {
-    '.java', '.ts', '.js', '.html', '.css', '.scss', '.sql'
+INCLUDE_EXTS = frozenset({
+    '.java', '.ts', '.js', '.html', '.css', '.scss', '.sql',
     '.properties', '.gradle', '.gitignore'
-}
+})
 
-INCLUDE_FILENAMES = {
+INCLUDE_FILENAMES = frozenset({
     'Dockerfile', 'docker-compose.yml', 'docker-compose.yaml',
     'build.gradle', 'application.properties', '.gitignore'
-}
+})
 
-FRONTEND_DIR_KEYWORDS = {
+FRONTEND_DIR_KEYWORDS = frozenset({
     'frontend', 'front-end', 'web', 'webapp', 'public', 'client', 'ui', 'app', 'static', 'templates'
-}
+})
+
+TEST_DIR_NAMES = frozenset({'test', 'tests'})
 
 TEST_SUFFIXES = {
     'Test.java', 'Tests.java', 'IT.java', 'Spec.java',
@@ -74,32 +83,91 @@ LLM_INSTRUCTIONS = (
 def is_skipped_dir(d: str) -> bool:
     return d in SKIP_DIRS or (d.startswith('.') and d not in {'.github', '.gitlab-ci'})
 
-def is_test_file(p: Path) -> bool:
-    name = p.name
+def file_suffix(name: str) -> str:
+    """Same result as PurePath(name).suffix, without building a Path."""
+    i = name.rfind('.')
+    return name[i:] if 0 < i < len(name) - 1 else ''
+
+# The predicates below take the file name plus the lowercased directory parts
+# leading to it; the parts are computed once per directory by walk_tree().
+
+def is_test_file(name: str, lower_parts: Tuple[str, ...]) -> bool:
     if any(name.endswith(suf) for suf in TEST_SUFFIXES):
         return True
-    lowered = [part.lower() for part in p.parts]
-    return 'test' in lowered or 'tests' in lowered
+    return not TEST_DIR_NAMES.isdisjoint(lower_parts) or name.lower() in TEST_DIR_NAMES
 
-def is_frontend_html(p: Path) -> bool:
+def is_frontend_html(name: str, lower_parts: Tuple[str, ...]) -> bool:
     return (
-            p.suffix.lower() == '.html'
-            and not is_test_file(p)
-            and any(k in [part.lower() for part in p.parts] for k in FRONTEND_DIR_KEYWORDS)
+            file_suffix(name).lower() == '.html'
+            and not is_test_file(name, lower_parts)
+            and not FRONTEND_DIR_KEYWORDS.isdisjoint(lower_parts)
     )
 
-def wants_content(p: Path) -> bool:
+def wants_content(name: str, lower_parts: Tuple[str, ...]) -> bool:
+    ext = file_suffix(name).lower()
     # Python files are excluded as requested
-    if p.suffix.lower() == '.py':
+    if ext == '.py':
         return False
-    return p.name in INCLUDE_FILENAMES or p.suffix.lower() in INCLUDE_EXTS or is_frontend_html(p)
+    return name in INCLUDE_FILENAMES or ext in INCLUDE_EXTS or is_frontend_html(name, lower_parts)
 
-def read_file(p: Path) -> str:
+def read_file(p: str) -> bytes:
+    """Return the raw file bytes; decoding is left to the output writers."""
     try:
-        with open(p, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read().rstrip('\n')  # strip only trailing newline added by editors
+        with open(p, 'rb') as f:
+            return f.read()
     except Exception as exc:
-        return f"<Error reading file: {exc}>"
+        return f"<Error reading file: {exc}>".encode('utf-8')
+
+def decode_content(raw: bytes) -> str:
+    """Decode bytes from read_file() the way text-mode open() would have."""
+    text = raw.rstrip(b'\n').decode('utf-8', errors='ignore')  # strip only trailing newline added by editors
+    if '\r' in text:
+        # Universal-newline translation, then re-strip the trailing newline
+        text = text.replace('\r\n', '\n').replace('\r', '\n').rstrip('\n')
+    return text
+
+def list_dir(top: str) -> Tuple[List[os.DirEntry], List[os.DirEntry]]:
+    """Return (files, subdirs) of top in name order, dropping skipped dirs."""
+    try:
+        with os.scandir(top) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return [], []
+
+    files, subdirs = [], []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        elif not is_skipped_dir(entry.name):
+            subdirs.append(entry)
+    return files, subdirs
+
+def walk_tree(top: str, rel_dir: str = '.',
+              lower_parts: Optional[Tuple[str, ...]] = None
+              ) -> Iterator[Tuple[str, str, Tuple[str, ...], List[os.DirEntry]]]:
+    """Top-down walk built on os.scandir.
+
+    Yields (dir_path, rel_dir, lower_parts, file_entries) for every directory,
+    with files and subdirectories in name order. lower_parts holds the
+    lowercased components of rel_dir and is extended one name per descent.
+    Unlike os.walk, the DirEntry objects are handed to the caller so their
+    cached type/stat data can be reused.
+    """
+    if lower_parts is None:
+        lower_parts = () if rel_dir == '.' else tuple(rel_dir.lower().split(os.sep))
+    files, subdirs = list_dir(top)
+    yield top, rel_dir, lower_parts, files
+
+    prefix = '' if rel_dir == '.' else rel_dir + os.sep
+    for entry in subdirs:
+        # Like os.walk(followlinks=False): list symlinked dirs, never descend
+        if not entry.is_symlink():
+            name = entry.name
+            yield from walk_tree(entry.path, prefix + name, lower_parts + (name.lower(),))
 
 def get_project_summary(root: Path) -> str:
     """Return first ~20 non‑empty lines from README or a default summary."""
@@ -130,121 +198,331 @@ def estimate_tokens(text: str) -> int:
     # Simple estimate: ~4 characters per token on average
     return len(text) // 4
 
+# Token counts keyed on a content digest, so identical boilerplate files
+# (.gitignore, application.properties, ...) are only counted once.
+TOKEN_CACHE_SIZE = 4096
+_token_cache: Dict[bytes, int] = {}
+
+def count_tokens(data: bytes) -> int:
+    """Token counter behind the cache; swap in a real tokenizer here.
+    Full scans pass the whole file, so this heuristic gives the same count that
+    --stats-only derives from the stat() size.
+    """
+    return len(data) // 4
+
+def tokenize_cached(data: bytes) -> int:
+    """Return the token count for data, memoized on its blake2b digest."""
+    if not data:
+        return 0
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    tokens = _token_cache.get(key)
+    if tokens is None:
+        if len(_token_cache) >= TOKEN_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _token_cache[next(iter(_token_cache))]
+        tokens = _token_cache[key] = count_tokens(data)
+    return tokens
+
+_BACKEND_PREFIX = 'backend' + os.sep
+_BACKEND_PREFIX_LEN = len(_BACKEND_PREFIX)
+
 def get_module_name(file_path: str) -> str:
     """Extract module name from file path.
-    Assumes a structure like 'backend/module_name/...'
+    Assumes a structure like 'backend/module_name/...'; anything else,
+    including files directly under backend/, counts towards 'root'.
     """
-    parts = file_path.split('/')
-    if len(parts) >= 2 and parts[0] == 'backend':
-        return parts[1]
+    if file_path.startswith(_BACKEND_PREFIX):
+        end = file_path.find(os.sep, _BACKEND_PREFIX_LEN)
+        if end != -1:
+            return file_path[_BACKEND_PREFIX_LEN:end]
     return 'root'  # Default module name for files not in a specific module
 
 # ---------------------------------------------------------------------------
 # Core scanner logic
 # ---------------------------------------------------------------------------
 
-def scan_project(root: Path, out_json_path: Path = None, out_txt_path: Path = None):
+def new_stats() -> dict:
+    return {
+        "total_files": 0,
+        "total_content_size": 0,  # in bytes, taken from stat()
+        "code_tokens": 0,
+        "module_token_counts": Counter(),
+    }
+
+def scan_files(dir_str: str, lower_parts: Tuple[str, ...], file_entries: List[os.DirEntry],
+               stats: dict, compute_content: bool = True, keep_content: bool = True) -> List[dict]:
+    """
+    Classify and measure the files of one directory, adding to stats.
+    Returns the JSON file entries; "content" is only filled in when keep_content is set.
+    """
+    # Bind hot globals/methods to locals once; the loop body runs per file.
+    _is_test = is_test_file
+    _wants = wants_content
+    _read = read_file
+    _tokens = tokenize_cached
+    _mod = get_module_name
+    _suffix = file_suffix
+    module_token_counts = stats["module_token_counts"]
+    prefix = '' if dir_str == '.' else dir_str + os.sep
+    total_files = total_content_size = code_tokens = 0
+    result = []
+
+    for entry in file_entries:
+        fname = entry.name
+        path_str = prefix + fname
+        if _is_test(fname, lower_parts):
+            continue
+
+        total_files += 1
+        suffix = _suffix(fname)
+        file_entry = {
+            "path": path_str,
+            "type": suffix.lstrip('.') if suffix else "unknown"
+        }
+
+        if _wants(fname, lower_parts):
+            # Size statistics come from the directory entry's metadata;
+            # the bytes are only decoded when an output needs the text.
+            try:
+                content_size = entry.stat().st_size
+            except OSError:
+                content_size = 0
+            if compute_content:
+                raw = _read(entry.path)
+                content_tokens = _tokens(raw)
+            else:
+                content_tokens = content_size // 4
+            total_content_size += content_size
+            code_tokens += content_tokens
+
+            # Track module token counts
+            module_token_counts[_mod(path_str)] += content_tokens
+
+            if compute_content and keep_content:
+                file_entry["content"] = decode_content(raw)
+
+        result.append(file_entry)
+
+    stats["total_files"] += total_files
+    stats["total_content_size"] += total_content_size
+    stats["code_tokens"] += code_tokens
+    return result
+
+def add_stats(total: dict, part: dict) -> None:
+    total["total_files"] += part["total_files"]
+    total["total_content_size"] += part["total_content_size"]
+    total["code_tokens"] += part["code_tokens"]
+    total["module_token_counts"].update(part["module_token_counts"])
+
+def scan_serial(top: str, rel_dir: str = '.', lower_parts: Optional[Tuple[str, ...]] = None,
+                stats: dict = None, compute_content: bool = True,
+                keep_content: bool = True) -> Iterator[Tuple[str, List[dict]]]:
+    """Yield (dir_str, file_entries) for one directory at a time, in walk order."""
+    for _, dir_str, dir_parts, file_entries in walk_tree(top, rel_dir, lower_parts):
+        yield dir_str, scan_files(dir_str, dir_parts, file_entries, stats, compute_content, keep_content)
+
+_FIRST_ENTRY_SEP = '\n    '
+_ENTRY_SEP = ',\n    '
+
+def write_dir(dir_str: str, file_entries: List[dict], json_out, txt_out, entry_sep: str) -> str:
+    """Write one directory's entries to the outputs; returns the separator for the next JSON entry."""
+    _dumps = json.dumps
+    if txt_out:
+        txt_out.write(f"[DIR] {dir_str}\n")
+    for file_entry in file_entries:
+        if json_out:
+            # Same layout json.dump(..., indent=2) gives a nested entry
+            json_out.write(entry_sep)
+            json_out.write(_dumps(file_entry, indent=2).replace('\n', '\n    '))
+            entry_sep = _ENTRY_SEP
+        if txt_out:
+            content = file_entry.get("content")
+            if content:
+                txt_out.write(f"=== {file_entry['path']} ===\n{content}\n")
+            else:
+                txt_out.write(f"=== {file_entry['path']} ===\n")
+    return entry_sep
+
+# Parallel scans list the top of the tree level by level until there are at least
+# as many subtrees as workers, going at most this many levels down.
+SPLIT_MAX_DEPTH = 4
+
+def split_tree(root: str, min_subtrees: int) -> List[tuple]:
+    """
+    Split the walk of root for a parallel scan. Returns the walk as an ordered list of
+    ('dir', rel_dir, lower_parts, file_entries) for directories listed here, and
+    ('tree', dir_path, rel_dir, lower_parts) for subtrees left to a worker.
+    Every directory is listed exactly once, here or by the worker.
+    """
+    listings = {}
+    level = [(root, '.', ())]
+    for _ in range(SPLIT_MAX_DEPTH):
+        next_level = []
+        for dir_path, rel_dir, lower_parts in level:
+            files, subdirs = list_dir(dir_path)
+            prefix = '' if rel_dir == '.' else rel_dir + os.sep
+            # Like walk_tree(): symlinked dirs are listed, never descended into
+            children = [(entry.path, prefix + entry.name, lower_parts + (entry.name.lower(),))
+                        for entry in subdirs if not entry.is_symlink()]
+            listings[dir_path] = (files, children)
+            next_level.extend(children)
+        level = next_level
+        if len(level) >= min_subtrees:
+            break
+
+    pieces = []
+    def add(dir_path: str, rel_dir: str, lower_parts: Tuple[str, ...]) -> None:
+        if dir_path not in listings:
+            pieces.append(('tree', dir_path, rel_dir, lower_parts))
+            return
+        files, children = listings[dir_path]
+        pieces.append(('dir', rel_dir, lower_parts, files))
+        for child in children:
+            add(*child)
+    add(root, '.', ())
+    return pieces
+
+def scan_subtree(top: str, rel_dir: str, lower_parts: Tuple[str, ...], spool_dir: str,
+                 write_json: bool, write_txt: bool) -> Tuple[List[str], dict, Optional[str], Optional[str]]:
+    """
+    Worker function for parallel scans, so it only takes and returns picklable values.
+    Walks one subtree and writes its output to spool files in spool_dir, which the
+    parent copies into the outputs in walk order; every JSON entry in the spool
+    starts with a separator, including the first.
+    Returns (directories, stats, json_spool, txt_spool).
+    """
+    stats = new_stats()
+    directories = []
+    with ExitStack() as stack:
+        json_out = txt_out = None
+        if write_json:
+            json_out = stack.enter_context(tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=spool_dir, suffix='.json', delete=False))
+        if write_txt:
+            txt_out = stack.enter_context(tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=spool_dir, suffix='.txt', delete=False))
+        for dir_str, file_entries in scan_serial(top, rel_dir, lower_parts, stats,
+                                                 keep_content=write_json or write_txt):
+            directories.append(dir_str)
+            write_dir(dir_str, file_entries, json_out, txt_out, _ENTRY_SEP)
+    return (directories, stats,
+            json_out.name if json_out else None, txt_out.name if txt_out else None)
+
+def copy_spool(spool: str, out, skip: int = 0) -> bool:
+    """Append a worker's spool file to out, dropping its first skip characters.
+    Returns whether anything was written."""
+    with open(spool, encoding='utf-8') as src:
+        if skip and not src.read(skip):
+            copied = False
+        else:
+            copied = True
+            shutil.copyfileobj(src, out)
+    os.remove(spool)
+    return copied
+
+def scan_project(root: Path, out_json_path: Path = None, out_txt_path: Path = None,
+                 compute_content: bool = True, parallel: bool = False):
     """
     Scan project and generate outputs. Returns statistics to avoid duplicate calculations.
+
+    With compute_content=False no file is opened: token estimates come from the
+    stat() size alone, matching what the default counter gives for the full
+    file, and no JSON/text output is written.
+    With parallel=True the tree is split into subtrees that worker processes walk
+    and render to spool files; these are copied in walk order, so the output is
+    the same as a serial scan. --stats-only scans, single-CPU hosts and trees
+    that do not split into at least two subtrees are always scanned serially.
+    Either way entries are written as they are produced, not collected first.
     """
+    if not compute_content:
+        out_json_path = out_txt_path = None
+    keep_content = bool(out_json_path or out_txt_path)
+
     project_name = root.name
     summary = get_project_summary(root)
     summary_tokens = estimate_tokens(summary)
     llm_instructions_tokens = estimate_tokens(LLM_INSTRUCTIONS)
 
-    total_files = 0
-    total_content_size = 0  # in characters
-    total_tokens = summary_tokens + llm_instructions_tokens
-    file_token_counts = {}
-    module_token_counts = defaultdict(int)
-
-    # Collect all data in one pass
+    stats = new_stats()
     all_directories = []
-    all_files = []
-
-    for dirpath, dirnames, filenames in os.walk(root, topdown=True):
-        dirnames[:] = [d for d in dirnames if not is_skipped_dir(d)]
-        dir_rel = Path(dirpath).relative_to(root)
-        dir_str = str(dir_rel if str(dir_rel) != '.' else '.')
-        all_directories.append(dir_str)
-
-        for fname in sorted(filenames):
-            fpath = Path(dirpath) / fname
-            rel = fpath.relative_to(root)
-            if is_test_file(rel):
-                continue
+    _dumps = json.dumps
 
-            total_files += 1
-            path_str = str(rel)
-
-            if wants_content(rel):
-                content = read_file(fpath)
-                content_tokens = estimate_tokens(content)
-                content_size = len(content)
-                total_content_size += content_size
-                total_tokens += content_tokens
-                file_token_counts[path_str] = content_tokens
-
-                # Track module token counts
-                module_name = get_module_name(path_str)
-                module_token_counts[module_name] += content_tokens
-
-                file_entry = {
-                    "path": path_str,
-                    "type": fpath.suffix.lstrip('.') if fpath.suffix else "unknown",
-                    "content": content
-                }
-                all_files.append((path_str, file_entry, content))
+    workers = os.cpu_count() or 1
+    if parallel and compute_content and workers > 1:
+        pieces = split_tree(str(root), workers)
+    else:
+        pieces = [('tree', str(root), '.', ())]
+    subtrees = [piece for piece in pieces if piece[0] == 'tree']
+
+    with ExitStack() as stack:
+        pending = {}
+        if len(subtrees) > 1:
+            spool_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            for _, dir_path, rel_dir, lower_parts in subtrees:
+                pending[rel_dir] = pool.submit(scan_subtree, dir_path, rel_dir, lower_parts, spool_dir,
+                                               bool(out_json_path), bool(out_txt_path))
+
+        json_out = stack.enter_context(open(out_json_path, 'w', encoding='utf-8')) if out_json_path else None
+        txt_out = stack.enter_context(open(out_txt_path, 'w', encoding='utf-8')) if out_txt_path else None
+
+        if json_out:
+            json_out.write('{\n')
+            json_out.write(f'  "project_name": {_dumps(project_name)},\n')
+            json_out.write(f'  "summary": {_dumps(summary)},\n')
+            json_out.write('  "files": [')
+        if txt_out:
+            txt_out.write(f"Project Name: {project_name}\n")
+            txt_out.write("Project Summary:\n")
+            txt_out.write(summary + "\n")
+
+        # Each directory's entries are written to the requested outputs as soon as
+        # they are available, then dropped.
+        entry_sep = _FIRST_ENTRY_SEP
+        for kind, *piece in pieces:
+            if kind == 'dir':
+                rel_dir, lower_parts, file_entries = piece
+                groups = [(rel_dir, scan_files(rel_dir, lower_parts, file_entries, stats,
+                                               compute_content, keep_content))]
+            elif piece[1] in pending:
+                directories, part, json_spool, txt_spool = pending.pop(piece[1]).result()
+                add_stats(stats, part)
+                all_directories.extend(directories)
+                if json_spool:
+                    # Drop the spool's leading ',' if no entry has been written yet
+                    skip = 1 if entry_sep == _FIRST_ENTRY_SEP else 0
+                    if copy_spool(json_spool, json_out, skip):
+                        entry_sep = _ENTRY_SEP
+                if txt_spool:
+                    copy_spool(txt_spool, txt_out)
+                continue
             else:
-                # Just record the path without content for files we don't want to process
-                file_entry = {
-                    "path": path_str,
-                    "type": fpath.suffix.lstrip('.') if fpath.suffix else "unknown"
-                }
-                all_files.append((path_str, file_entry, None))
-
-    # Generate JSON output if requested
-    if out_json_path:
-        result = {
-            "project_name": project_name,
-            "summary": summary,
-            "directories": all_directories,
-            "files": [file_data for _, file_data, _ in all_files],
-            "llm_instructions": LLM_INSTRUCTIONS
-        }
-
-        with open(out_json_path, 'w', encoding='utf-8') as out:
-            json.dump(result, out, indent=2)
-
-    # Generate text output if requested
-    if out_txt_path:
-        with open(out_txt_path, 'w', encoding='utf-8') as out:
-            out.write(f"Project Name: {project_name}\n")
-            out.write("Project Summary:\n")
-            out.write(summary + "\n")
-
-            for dir_path in all_directories:
-                out.write(f"[DIR] {dir_path}\n")
-
-            for path_str, _, content in all_files:
-                header = f"=== {path_str} ==="
-                if content:
-                    out.write(f"{header}\n{content}\n")
-                else:
-                    out.write(f"{header}\n")
-
-            out.write("LLM Instructions:\n")
-            out.write(LLM_INSTRUCTIONS)
+                groups = scan_serial(*piece, stats, compute_content, keep_content)
+
+            for dir_str, file_entries in groups:
+                all_directories.append(dir_str)
+                entry_sep = write_dir(dir_str, file_entries, json_out, txt_out, entry_sep)
+
+        if json_out:
+            json_out.write('\n  ],\n' if entry_sep != _FIRST_ENTRY_SEP else '],\n')
+            json_out.write('  "directories": ')
+            json_out.write(_dumps(all_directories, indent=2).replace('\n', '\n  '))
+            json_out.write(',\n')
+            json_out.write(f'  "llm_instructions": {_dumps(LLM_INSTRUCTIONS)}\n')
+            json_out.write('}')
+        if txt_out:
+            txt_out.write("LLM Instructions:\n")
+            txt_out.write(LLM_INSTRUCTIONS)
 
     # Return statistics
     return {
-        "total_files": total_files,
-        "total_content_size": total_content_size,
-        "total_tokens": total_tokens,
+        "total_files": stats["total_files"],
+        "total_content_size": stats["total_content_size"],
+        "total_tokens": summary_tokens + llm_instructions_tokens + stats["code_tokens"],
         "summary_tokens": summary_tokens,
-        "code_tokens": total_tokens - summary_tokens - llm_instructions_tokens,
+        "code_tokens": stats["code_tokens"],
         "llm_instructions_tokens": llm_instructions_tokens,
-        "module_token_counts": module_token_counts
+        "module_token_counts": stats["module_token_counts"]
     }
 
 def print_statistics(stats):
@@ -254,14 +532,14 @@ def print_statistics(stats):
     print(f"- Summary tokens: {stats['summary_tokens']}")
     print(f"- Code tokens: {stats['code_tokens']}")
     print(f"- LLM instructions tokens: {stats['llm_instructions_tokens']}")
-    print(f"\nTotal character count: {stats['total_content_size']}")
+    print(f"\nTotal content size (bytes): {stats['total_content_size']}")
     print(f"Total files: {stats['total_files']}")
 
     print("\nTop 3 modules by token count:")
 
     # Get top 3 modules by token count
     module_counts = stats['module_token_counts']
-    top_modules = sorted(module_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+    top_modules = module_counts.most_common(3)
     for i, (module, tokens) in enumerate(top_modules, 1):
         print(f"{i}. Module '{module}': {tokens} tokens ({tokens/stats['total_tokens']*100:.1f}%)")
 
@@ -272,12 +550,23 @@ def print_statistics(stats):
 # Entry‑point
 # ---------------------------------------------------------------------------
 if __name__ == '__main__':
-    root = Path(sys.argv[1]) if len(sys.argv) > 1 else Path.cwd()
+    parser = argparse.ArgumentParser(description='Project scanner with token calculation')
+    parser.add_argument('root_dir', nargs='?', default=os.getcwd(),
+                        help='Root directory to scan (default: current directory)')
+    parser.add_argument('output_file', nargs='?',
+                        help='Output file path (default: <root_dir>_scan.json)')
+    parser.add_argument('--stats-only', action='store_true',
+                        help='Only print token/module statistics; no file is read and no output is written')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Scan subtrees in worker processes; pays off on large trees with many CPUs')
+    args = parser.parse_args()
+
+    root = Path(args.root_dir)
     if not root.is_dir():
         sys.exit('First argument must be a directory to scan.')
 
-    if len(sys.argv) > 2:
-        out_file = Path(sys.argv[2])
+    if args.output_file:
+        out_file = Path(args.output_file)
         use_json = out_file.suffix.lower() == '.json'
     else:
         # Default to JSON format
@@ -293,13 +582,16 @@ if __name__ == '__main__':
         txt_path = out_file
 
     # Run scan once and get statistics
-    stats = scan_project(root, json_path, txt_path)
+    stats = scan_project(root, json_path, txt_path, compute_content=not args.stats_only,
+                         parallel=args.parallel)
 
     # Print statistics once
     print_statistics(stats)
 
     # Display completion message
-    if use_json:
+    if args.stats_only:
+        print("\nProject scan completed (stats only, no output written).")
+    elif use_json:
         print(f"\nProject scan completed. Output written to {json_path} and {txt_path}")
     else:
-        print(f"\nProject scan completed. Output written to {txt_path}")
\ No newline at end of file
+        print(f"\nProject scan completed. Output written to {txt_path}")
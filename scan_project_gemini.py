@@ -16,10 +16,17 @@ import sys
 from pathlib import Path
 import argparse # For more robust argument parsing
 import re # For cleaning up empty lines
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # ---------------- default constants -----------------------------------------
 MAX_DEPTH_DEFAULT = 15      # Max directory depth to scan
 MAX_FILE_SIZE_KB_DEF = 1024  # Size limit for file content in KB
+READ_WORKERS = min(32, (os.cpu_count() or 4) * 4)  # Threads used to read file contents
+MAX_PENDING_READS = READ_WORKERS * 4  # Reads allowed to run ahead of the writer
+MAX_PENDING_LISTINGS = 4  # Subdirectory listings allowed to run ahead of the walk
+OUTPUT_BUFFER_SIZE = 1 << 20  # Write buffer for the output file
 # -----------------------------------------------------------------------------
 
 # Files/extensions for which content should be included
@@ -34,15 +41,23 @@ FILES_WITH_CONTENT_BY_EXT = {
 }
 HTML_EXTENSION = '.html'
 
+# What to do with a file, keyed by lowercased extension: 'read' includes the
+# content, 'html' includes it unless it looks like a test file. Names in
+# FILES_WITH_CONTENT_BY_NAME are checked only when the extension gives no action.
+_EXT_ACTION = {ext: 'read' for ext in FILES_WITH_CONTENT_BY_EXT}
+_EXT_ACTION[HTML_EXTENSION] = 'html'
+
 # Directories to skip
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     '.git', '.svn', '.hg', '.idea', '.vscode', '.vs', 'nbproject', '.project', '.settings',
     'target', 'build', 'dist', 'out', 'bin', 'obj', 'release', 'coverage',
     'node_modules', 'vendor', 'bower_components', '.m2',
     'venv', '.venv', 'env', '.env', 'ENV', '__pycache__', '.pytest_cache', '.mypy_cache', '.tox',
     'logs', 'temp', 'tmp', 'data', 'uploads', '.DS_Store', 'Thumbs.db',
     '.gradle', '.sass-cache', 'jekyll-cache'
-}
+})
+# Dot-directories that are scanned anyway; every other '.name' dir is skipped
+_DOT_WHITELIST = frozenset({'.github', '.gitlab-ci'})
 
 # Test file patterns - used to identify test HTML files
 TEST_FILE_PATTERNS = {
@@ -55,18 +70,26 @@ TEST_FILE_SUFFIXES = {
     '.test.tsx', '_test.py', '_spec.rb', '_test.go', 'Tests.cs'
 }
 
-def is_skipped_dir(dirname: str, dir_path: Path) -> bool:
-    if dirname.startswith('.') and dirname not in {'.github', '.gitlab-ci'}:
-        return True
-    return dirname in SKIP_DIRS
+# Substring patterns folded into one compiled regex, built once at import
+_PAT_RE = re.compile('|'.join(map(re.escape, sorted(TEST_FILE_PATTERNS))))
 
-def is_test_file(file_path: Path) -> bool:
-    filename = file_path.name
-    if any(pattern in filename for pattern in TEST_FILE_PATTERNS):
-        return True
-    if any(filename.endswith(suffix) for suffix in TEST_FILE_SUFFIXES):
+# Test suffixes bucketed by their trailing extension, so a file is only checked
+# against the few suffixes that share its extension
+_SUFFIX_BY_EXT: dict[str, tuple[str, ...]] = {}
+for _suffix in sorted(TEST_FILE_SUFFIXES):
+    _ext = _suffix[_suffix.rfind('.'):]
+    _SUFFIX_BY_EXT[_ext] = _SUFFIX_BY_EXT.get(_ext, ()) + (_suffix,)
+del _suffix, _ext
+
+@lru_cache(maxsize=4096)
+def _is_test_name(filename: str) -> bool:
+    if _PAT_RE.search(filename):
         return True
-    parts = [part.lower() for part in file_path.parts]
+    dot = filename.rfind('.')
+    bucket = _SUFFIX_BY_EXT.get(filename[dot:]) if dot != -1 else None
+    return bool(bucket) and filename.endswith(bucket)
+
+def _is_test_location(parts: list[str]) -> bool:
     if 'test' in parts or 'tests' in parts:
         try:
             src_index = parts.index('src')
@@ -77,51 +100,112 @@ def is_test_file(file_path: Path) -> bool:
             return True
     return False
 
-def read_file_content(file_full_path: Path, max_kb: int) -> str:
+@lru_cache(maxsize=4096)
+def _is_test_dir(dir_path: str) -> bool:
+    return _is_test_location(dir_path.lower().split(os.sep))
+
+def is_test_file(file_path: str) -> bool:
+    dir_path, filename = os.path.split(file_path)
+    if _is_test_name(filename):
+        return True
+    # The directory part is shared by every file in it, so its verdict is cached;
+    # only a file itself named src/test/tests can change the answer.
+    if filename.lower() in ('src', 'test', 'tests'):
+        return _is_test_location(file_path.lower().split(os.sep))
+    return _is_test_dir(dir_path)
+
+def file_suffix(filename: str) -> str:
+    """Same result as PurePath(filename).suffix, without building a path object."""
+    i = filename.rfind('.')
+    if 0 < i < len(filename) - 1:
+        return filename[i:]
+    return ''
+
+# Generated bundles are effectively one long line, so a truncated prefix of
+# one is of no use; oversized ones are noted without being opened.
+_BUNDLE_SUFFIXES = ('.min.js', '.min.css', '.bundle.js', '.chunk.js')
+
+def content_from_size(filename: str, max_kb: int, file_size: int) -> bytes | None:
+    """Return the content for files that can be decided from their size alone, else None."""
+    if file_size == 0:
+        return b"<Empty file>"
+    if max_kb > 0 and file_size > max_kb * 1024 and filename.lower().endswith(_BUNDLE_SUFFIXES):
+        return f"<Skipped: size={file_size} bytes exceeds cap>".encode('utf-8')
+    return None
+
+def read_file_content(file_full_path: str, max_kb: int, file_size: int | None = None) -> bytes:
+    """Return the file's raw bytes, cut to max_kb, followed by any truncation notice.
+
+    Nothing is decoded here; compact_file_content() decodes only when the
+    content is not plain ASCII. file_size may be passed in from a DirEntry to
+    skip the stat() call.
+    """
     try:
-        file_size = file_full_path.stat().st_size
+        if file_size is None:
+            file_size = os.stat(file_full_path).st_size
         if file_size == 0:
-            return "<Empty file>"
+            return b"<Empty file>"
         if max_kb > 0 and file_size > max_kb * 1024:
             truncate_msg = f"\n\n... [File truncated at {max_kb}KB (original size: {file_size / 1024:.2f}KB)] ..."
             max_bytes_to_read = max_kb * 1024
         else:
             truncate_msg = ""
             max_bytes_to_read = -1
-        with open(file_full_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read(max_bytes_to_read)
-            if truncate_msg:
-                last_newline = content.rfind('\n')
-                if last_newline != -1:
-                    content = content[:last_newline]
-                content += truncate_msg
-            return content
+        with open(file_full_path, 'rb', buffering=0) as f:
+            raw = f.read(max_bytes_to_read)
+        if truncate_msg:
+            # Cut at the last newline so discarded bytes are never decoded
+            last_newline = raw.rfind(b'\n')
+            if last_newline != -1:
+                raw = raw[:last_newline]
+            raw += truncate_msg.encode('ascii')
+        return raw
     except FileNotFoundError:
-        return f"<File not found: {file_full_path}>"
+        return f"<File not found: {file_full_path}>".encode('utf-8')
     except Exception as e:
-        return f"<Error reading file {file_full_path}: {e}>"
+        return f"<Error reading file {file_full_path}: {e}>".encode('utf-8')
+
+def _list_dir(dir_path_str: str) -> list[os.DirEntry] | None:
+    """Return the entries of one directory, or None if it cannot be listed."""
+    try:
+        with os.scandir(dir_path_str) as it:
+            return list(it)
+    except OSError:
+        return None
+
+README_MAX_BYTES = 16 * 1024  # The summary only uses the first 20 non-empty lines
 
 def get_project_summary_from_readme_file(root_dir: Path) -> str:
-    readme_filenames = ['README.md', 'README.txt', 'readme.md']
+    readme_filenames = ('README.md', 'README.txt', 'readme.md')
+    root_dir_str = str(root_dir)
     summary = ""
     for readme_name in readme_filenames:
-        readme_path = root_dir / readme_name
-        if readme_path.exists() and readme_path.is_file():
-            try:
-                with open(readme_path, 'r', encoding='utf-8', errors='ignore') as rf:
-                    lines = []
-                    non_empty_lines_count = 0
-                    for i, line in enumerate(rf):
-                        if non_empty_lines_count >= 20: break
-                        stripped_line = line.strip()
-                        if stripped_line: non_empty_lines_count += 1
-                        if non_empty_lines_count > 3 and (stripped_line.startswith('## ') or stripped_line.startswith('### ')): break
-                        lines.append(line)
-                    summary = "".join(lines).strip()
-                    if summary: return summary
-            except Exception: pass
+        try:
+            fd = os.open(os.path.join(root_dir_str, readme_name), os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            raw = os.read(fd, README_MAX_BYTES)
+        except OSError:
+            continue
+        finally:
+            os.close(fd)
+        text = raw.decode('utf-8', errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        lines = []
+        non_empty_lines_count = 0
+        for line in text.split('\n'):
+            if non_empty_lines_count >= 20: break
+            stripped_line = line.strip()
+            if stripped_line: non_empty_lines_count += 1
+            if non_empty_lines_count > 3 and (stripped_line.startswith('## ') or stripped_line.startswith('### ')): break
+            lines.append(line)
+        summary = "\n".join(lines).strip()
+        if summary: return summary
     return summary
 
+@lru_cache(maxsize=8)
 def get_default_project_summary(project_name: str) -> str:
     return f"""Project Name: {project_name} (Multi-Restaurant Platform)
 
@@ -251,6 +335,101 @@ To effectively assist me, please adhere to the following:
 By following these guidelines, we can have a productive and efficient collaboration. Try to guess the current state of the project so that we can continue from there. Ask to provide you the relavant files like java classes, build.gradle, settings.gradle, application.properties, dockerfile etc. And guide me with the next steps. Carefully check content of the project what is currently done. first create the step and ask me if i want to proceed with your suggestion. Dont ask me what specific aspect of the project I'd like to discuss next. you decide and ask me if your plan is correct and if i want to proceed with your plan
 """
 
+# Sequences of two or more newlines (possibly with whitespace between them)
+# collapse to a single newline, removing all purely empty lines used for spacing.
+# Equivalent to (\n\s*){2,} but without the repeated capturing group: the run
+# must contain a second newline, after which all trailing whitespace goes too.
+_BLANK_RE = re.compile(r'\n[^\S\n]*\n\s*')
+
+def _compacted(segment: str) -> bytes:
+    """Compact and encode one output segment.
+
+    Every segment starts with non-whitespace and ends with a single newline,
+    so compacting segment by segment gives the same text as compacting the
+    whole document at once. A blank run needs two newlines, so segments
+    with fewer (headers, banners, folder notes) skip the regex.
+    """
+    if segment.count('\n') < 2:
+        return segment.encode('utf-8')
+    return _BLANK_RE.sub('\n', segment).encode('utf-8')
+
+def _emit(out, segment: str) -> None:
+    out.write(_compacted(segment))
+
+def _write_chunks(out, chunks: list[bytes]) -> None:
+    """Write ready-made chunks with as few syscalls as possible.
+
+    The buffered writer is flushed first, then the chunks go to its file
+    descriptor in one os.writev call (repeated only on a short write). Falls
+    back to plain writes where os.writev is unavailable.
+    """
+    chunks = [chunk for chunk in chunks if chunk]
+    if not hasattr(os, 'writev'):
+        for chunk in chunks:
+            out.write(chunk)
+        return
+    out.flush()
+    fd = out.fileno()
+    while chunks:
+        written = os.writev(fd, chunks)
+        while chunks and written >= len(chunks[0]):
+            written -= len(chunks[0])
+            chunks.pop(0)
+        if written:
+            chunks[0] = chunks[0][written:]
+
+# Byte-level twins of _BLANK_RE and str.strip() for pure-ASCII content. They
+# spell out every ASCII character str treats as whitespace (\x1c-\x1f included),
+# so ASCII files compact exactly as they would after decoding.
+_ASCII_WS = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
+_BLANK_BYTES_RE = re.compile(rb'\n[ \t\r\x0b\x0c\x1c-\x1f]*\n[ \t\n\r\x0b\x0c\x1c-\x1f]*')
+
+def compact_file_content(raw: bytes) -> bytes:
+    """Normalize newlines, strip and compact one file's content, returning UTF-8.
+
+    ASCII content (most source files) never leaves bytes; anything else is
+    decoded, dropping invalid UTF-8, and handled as text. Content with fewer
+    than two newlines cannot hold a blank run and skips the regex.
+    """
+    if raw.isascii():
+        if b'\r' in raw:
+            raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        raw = raw.strip(_ASCII_WS)
+        if raw.count(b'\n') < 2:
+            return raw
+        return _BLANK_BYTES_RE.sub(b'\n', raw)
+    content = raw.decode('utf-8', errors='ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    content = content.strip()
+    if content.count('\n') < 2:
+        return content.encode('utf-8')
+    return _BLANK_RE.sub('\n', content).encode('utf-8')
+
+def read_compacted_content(file_full_path: str, max_kb: int, file_size: int | None = None) -> bytes:
+    """Read and compact one file, so both happen on the worker thread."""
+    return compact_file_content(read_file_content(file_full_path, max_kb, file_size))
+
+def _write_file_block(out, rel_path: str, content: bytes) -> None:
+    """Write one 'File:' block for content already passed through compact_file_content.
+
+    The compacted content starts and ends with non-whitespace, so the newlines
+    around it never form a blank run; only empty content needs care.
+    """
+    header = f"File: {rel_path}\n".encode('utf-8')
+    if not content:
+        out.write(header)
+    elif len(content) >= OUTPUT_BUFFER_SIZE:
+        # Would bypass the buffer anyway; send all three parts in one syscall
+        _write_chunks(out, [header, content, b"\n"])
+    else:
+        out.write(header)
+        out.write(content)
+        out.write(b"\n")
+
+# The instructions are a literal, so compact and encode them once at import.
+_LLM_INSTRUCTIONS_BYTES = _BLANK_RE.sub('\n', LLM_INSTRUCTIONS.strip() + "\n").encode('utf-8')
+
 
 def scan_project_to_text(
         root_dir_str: str,
@@ -261,6 +440,8 @@ def scan_project_to_text(
 ) -> None:
     root_dir = Path(root_dir_str).resolve()
     script_full_path = Path(__file__).resolve() if Path(__file__).is_file() else None
+    script_key = str(script_full_path) if script_full_path else None
+    script_name = script_full_path.name if script_full_path else None
     project_name = root_dir.name
 
     final_project_summary = project_summary_cmd_arg
@@ -269,98 +450,140 @@ def scan_project_to_text(
     if not final_project_summary:
         final_project_summary = get_default_project_summary(project_name)
 
-    processed_files_for_text = []
+    files_with_content_count = 0
     empty_folder_reports = [] # Will store strings without trailing newlines
     files_processed_count = 0
 
-    for dir_path_str, dirnames, filenames in os.walk(root_dir, topdown=True):
-        current_dir_path = Path(dir_path_str)
-        relative_dir_path = current_dir_path.relative_to(root_dir)
-        current_depth = len(relative_dir_path.parts)
-
-        if current_depth > max_scan_depth :
-            dirnames[:] = []
-            filenames[:] = []
-            continue
-
-        dirnames[:] = [d for d in dirnames if not is_skipped_dir(d, current_dir_path / d)]
-
-        if not filenames and not dirnames:
-            if str(relative_dir_path) != '.':
-                empty_folder_reports.append(
-                    f"Folder: {relative_dir_path.as_posix()} (nothing implemented yet for this folder as it is empty or contains no scannable items)"
-                ) # No \n here
-
-        for filename in filenames:
-            if current_depth == max_scan_depth and relative_dir_path.name == filename:
-                pass
-            elif current_depth >= max_scan_depth :
-                if len(relative_dir_path.parts) > max_scan_depth : continue
-
-            file_path = current_dir_path / filename
-            if script_full_path and file_path.exists() and script_full_path.exists() and file_path.samefile(script_full_path):
-                continue
-
-            relative_file_path = file_path.relative_to(root_dir)
-            file_ext = file_path.suffix.lower()
-
-            should_read_content = False
-            if file_path.name in FILES_WITH_CONTENT_BY_NAME:
-                should_read_content = True
-            elif file_ext in FILES_WITH_CONTENT_BY_EXT:
-                should_read_content = True
-            elif file_ext == HTML_EXTENSION:
-                if not is_test_file(file_path):
-                    should_read_content = True
-
-            if should_read_content:
-                content_to_store = read_file_content(file_path, max_file_size_kb)
-                processed_files_for_text.append({
-                    'path': str(relative_file_path.as_posix()),
-                    'content': content_to_store
-                })
-            files_processed_count +=1
-
-    processed_files_for_text.sort(key=lambda x: x['path'])
-    empty_folder_reports.sort()
-
-    output_parts = []
-    output_parts.append(f"Project Name: {project_name}\n")
-    output_parts.append(f"Project Summary:\n{final_project_summary.strip()}\n")
-
-    if not processed_files_for_text and not empty_folder_reports:
-        output_parts.append("No scannable files or empty folders found with the current criteria.\n")
-    else:
-        if processed_files_for_text:
-            output_parts.append("-" * 40 + " FILES " + "-" * 40 + "\n")
-            for item in processed_files_for_text:
-                output_parts.append(f"File: {item['path']}\n")
-                output_parts.append(f"{item['content'].strip()}\n")
-
-        if empty_folder_reports:
-            output_parts.append("-" * 40 + " EMPTY FOLDERS " + "-" * 40 + "\n")
-            for report_text in empty_folder_reports:
-                output_parts.append(report_text + "\n")
-
-    output_parts.append(LLM_INSTRUCTIONS.strip() + "\n")
-
-    # Join all parts and then clean up excessive newlines
-    raw_output_text = "".join(output_parts)
-
-    # Replace sequences of two or more newlines (possibly with whitespace between them) with a single newline.
-    # This makes the output compact, removing all purely empty lines used for spacing.
-    compact_output_text = re.sub(r'(\n\s*){2,}', '\n', raw_output_text)
-
-    # Ensure the final text is stripped of any leading/trailing whitespace and ends with exactly one newline.
-    final_output_text = compact_output_text.strip() + '\n'
-
     try:
-        with open(output_file_str, 'w', encoding='utf-8') as f:
-            f.write(final_output_text)
-        print(f"Project scan (Plain Text) complete → {Path(output_file_str).resolve()}")
-        print(f"Total files encountered (relevant for listing, not skipped by dir rules): {files_processed_count}")
-        print(f"Files with content included: {len(processed_files_for_text)}")
-        print(f"Empty folders reported: {len(empty_folder_reports)}")
+        # Files are emitted in sorted path order as the walk reaches them, so no
+        # content list is built or sorted; each segment is compacted on its own
+        # and written straight to disk.
+        with open(output_file_str, 'wb', buffering=OUTPUT_BUFFER_SIZE) as out, \
+                ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            _emit(out, f"Project Name: {project_name}\n")
+            _emit(out, f"Project Summary:\n{final_project_summary.strip()}\n")
+
+            # File reads are I/O-bound and release the GIL, so they run ahead on
+            # threads; results are written in submission order and at most
+            # MAX_PENDING_READS contents are held in memory at once. Entries whose
+            # content is known from the size alone hold that text instead of a future.
+            pending_reads = deque()
+
+            def write_ready(limit: int) -> None:
+                while len(pending_reads) > limit:
+                    rel_path, pending = pending_reads.popleft()
+                    content = pending if isinstance(pending, bytes) else pending.result()
+                    _write_file_block(out, rel_path, content)
+
+            # Iterative depth-first walk over os.scandir; DirEntry objects carry
+            # the file type from the directory listing, so no extra stat is needed
+            # to classify entries. Directories deeper than max_scan_depth are never
+            # listed. Within a directory, files sort by name and subdirectories by
+            # name + '/', which visits files in the same order as sorting their
+            # full relative paths. When a directory is listed, its first few
+            # subdirectories have their listings requested on the pool, so those
+            # scandir calls overlap with the work on the current directory; at
+            # most MAX_PENDING_LISTINGS are outstanding, and any other directory
+            # holds its path and is listed when the walk reaches it.
+            pending_listings = 0
+            stack = [iter([('', None, str(root_dir), '', 0)])]
+            while stack:
+                child = next(stack[-1], None)
+                if child is None:
+                    stack.pop()
+                    continue
+                _, file_entry, dir_listing, relative_dir, current_depth = child
+
+                if file_entry is not None:
+                    entry = file_entry
+                    filename = entry.name
+                    file_path = entry.path
+                    # Skip this script itself; only a same-named file needs the realpath check
+                    if filename == script_name and (file_path == script_key or os.path.realpath(file_path) == script_key):
+                        continue
+
+                    relative_file_path = f"{relative_dir}/{filename}" if relative_dir else filename
+                    file_ext = file_suffix(filename).lower()
+
+                    action = _EXT_ACTION.get(file_ext) or ('read' if filename in FILES_WITH_CONTENT_BY_NAME else None)
+                    if action == 'html' and is_test_file(file_path):
+                        action = None
+
+                    if action:
+                        if not files_with_content_count:
+                            _emit(out, "-" * 40 + " FILES " + "-" * 40 + "\n")
+                        files_with_content_count += 1
+                        try:
+                            file_size = entry.stat().st_size
+                        except OSError:
+                            file_size = None
+                        content = None if file_size is None else content_from_size(filename, max_file_size_kb, file_size)
+                        if content is None:
+                            content = executor.submit(read_compacted_content, file_path, max_file_size_kb, file_size)
+                        pending_reads.append((relative_file_path, content))
+                        write_ready(MAX_PENDING_READS)
+                    files_processed_count +=1
+                    continue
+
+                if isinstance(dir_listing, str):
+                    entries = _list_dir(dir_listing)
+                else:
+                    entries = dir_listing.result()
+                    pending_listings -= 1
+                if entries is None:
+                    continue
+
+                children = []
+                has_subdirs = False
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        children.append((entry.name, entry, None, relative_dir, current_depth))
+                    elif not ((entry.name[0] == '.' and entry.name not in _DOT_WHITELIST) or entry.name in SKIP_DIRS):
+                        has_subdirs = True
+                        # Like os.walk(followlinks=False): never descend into symlinked dirs
+                        if current_depth < max_scan_depth and not entry.is_symlink():
+                            child_relative = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                            children.append((entry.name + '/', None, entry.path, child_relative, current_depth + 1))
+
+                if not has_subdirs and not children and relative_dir:
+                    empty_folder_reports.append(
+                        f"Folder: {relative_dir} (nothing implemented yet for this folder as it is empty or contains no scannable items)"
+                    ) # No \n here
+
+                children.sort(key=lambda c: c[0])
+                if has_subdirs:
+                    for i, child in enumerate(children):
+                        if pending_listings >= MAX_PENDING_LISTINGS:
+                            break
+                        if child[1] is None:
+                            children[i] = child[:2] + (executor.submit(_list_dir, child[2]),) + child[3:]
+                            pending_listings += 1
+                stack.append(iter(children))
+
+            write_ready(0)
+
+            # The tail of the document is known in full once the walk ends, so it
+            # goes out in a single vectored write
+            empty_folder_reports.sort()
+            tail = []
+            if not files_with_content_count and not empty_folder_reports:
+                tail.append(_compacted("No scannable files or empty folders found with the current criteria.\n"))
+            elif empty_folder_reports:
+                tail.append(_compacted("-" * 40 + " EMPTY FOLDERS " + "-" * 40 + "\n"))
+                tail.append(b"".join(_compacted(report_text + "\n") for report_text in empty_folder_reports))
+            tail.append(_LLM_INSTRUCTIONS_BYTES)
+            _write_chunks(out, tail)
+
+        sys.stdout.write(
+            f"Project scan (Plain Text) complete → {os.path.abspath(output_file_str)}\n"
+            f"Total files encountered (relevant for listing, not skipped by dir rules): {files_processed_count}\n"
+            f"Files with content included: {files_with_content_count}\n"
+            f"Empty folders reported: {len(empty_folder_reports)}\n"
+        )
 
     except Exception as e:
         print(f"Error writing Plain Text output to {output_file_str}: {e}")
@@ -17,17 +17,29 @@ Project scanner optimized for LLM code analysis - Plain Text Output
 """
 
 import argparse
+import fnmatch
+import io
 import os
 import re
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import BinaryIO, Iterator
+import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import lru_cache
 
 # --- Configuration Constants ---
 MAX_DEPTH_DEFAULT = 10
 MAX_FILE_SIZE_KB_DEF = 32  # More conservative default
 MAX_CONTENT_LINES_DEF = 150 # More conservative default
 OUTPUT_FILENAME_DEFAULT = "llm_project_context.txt"
+READ_WORKERS = 16 # Threads reading file contents; reads are I/O-bound and release the GIL
+# A NUL byte within this many leading bytes marks a file as binary
+BINARY_SNIFF_BYTES = 512
+OUTPUT_BUFFER_SIZE = 8 << 20 # Write buffer for the output file; large so big outputs go out in few writes
 
 # Files/extensions for which content should be included
 DEFAULT_FILES_WITH_CONTENT_BY_NAME = {
@@ -66,40 +78,61 @@ DEFAULT_IGNORE_FILES = {
     'package-lock.json', 'yarn.lock', 'composer.lock', 'Gemfile.lock', 'poetry.lock',
     '*.min.js', '*.min.css',
     '*.map'
-    # Note: 'scan_project*' is now handled directly in is_ignored
+    # Note: 'scan_project*' is now handled directly in is_ignored_entry
 }
 
 # --- Helper Functions ---
 
-def safe_read_file(path: Path, max_size_bytes: int, max_lines: int, head_ratio: float = 0.7, tail_ratio: float = 0.2) -> tuple[str | None, bool]:
+def safe_read_file(path: str, max_size_bytes: int, max_lines: int, head_ratio: float = 0.7, tail_ratio: float = 0.2,
+                   file_size: int | None = None) -> tuple[str | None, str | None]:
     """
     Reads a file, truncating if it's too large (by size or lines).
     For line-based truncation, attempts to show a head/tail snippet of the first `max_lines`.
-    Returns (content, is_truncated)
+    The file is opened and read once; `file_size` may be passed in from a DirEntry to skip
+    opening empty files and to size the read. Files with a NUL byte near the start are
+    treated as binary and not decoded.
+    Returns (content, notice); notice is the size-truncation message to write after the
+    content, or None. A line-truncation message is part of the content, between head and tail.
     """
     try:
-        file_stat_size = path.stat().st_size
-        if file_stat_size == 0:
-            return "(empty file)", False
-
-        if file_stat_size > max_size_bytes:
-            with path.open('r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(max_size_bytes)
-            return content + f"\n... (file content truncated: exceeds {max_size_bytes // 1024}KB size limit)", True
+        if file_size == 0:
+            return "(empty file)", None
 
+        # One read of up to max_size_bytes + 1 bytes tells whether the size limit was exceeded
+        if max_size_bytes < 0:
+            read_size = -1
+        else:
+            read_size = (max_size_bytes if file_size is None else min(file_size, max_size_bytes)) + 1
+        with open(path, 'rb') as f:
+            raw = f.read(read_size)
+        if not raw:
+            return "(empty file)", None
+        if b'\x00' in raw[:BINARY_SNIFF_BYTES]:
+            return "(binary file skipped)", None
+
+        exceeds_size = max_size_bytes < len(raw)
+        if exceeds_size and max_size_bytes >= 0:
+            raw = raw[:max_size_bytes]
+        text = raw.decode('utf-8', errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if exceeds_size:
+            return text, f"... (file content truncated: exceeds {max_size_bytes // 1024}KB size limit)"
+
+        # Split into lines the way text-mode iteration does ('\n' only, newline kept),
+        # stopping after max_lines
         lines_read_up_to_max = []
         is_longer_than_max_lines = False
-
-        with path.open('r', encoding='utf-8', errors='ignore') as f:
-            for i, line in enumerate(f):
-                if i < max_lines:
-                    lines_read_up_to_max.append(line)
-                else:
-                    is_longer_than_max_lines = True
-                    break
+        if max_lines > 0:
+            parts = text.split('\n', max_lines)
+            lines_read_up_to_max = [part + '\n' for part in parts[:-1]]
+            if len(parts) > max_lines:
+                is_longer_than_max_lines = parts[-1] != ''
+            elif parts[-1]:
+                lines_read_up_to_max.append(parts[-1])
 
         if not lines_read_up_to_max:
-            return "(empty file or read error after size check)", False
+            return "(empty file or read error after size check)", None
 
         if is_longer_than_max_lines:
             head_count = int(max_lines * head_ratio)
@@ -122,9 +155,8 @@ def safe_read_file(path: Path, max_size_bytes: int, max_lines: int, head_ratio:
             if tail_count < 0: tail_count = 0
             if head_count == 0 and tail_count == 0 and max_lines > 0: head_count = 1
 
-            output_parts = []
-            if head_count > 0:
-                output_parts.append("".join(lines_read_up_to_max[:head_count]))
+            # Head, message and tail are joined in one go rather than each part separately
+            output_parts = lines_read_up_to_max[:head_count]
 
             num_shown_lines = head_count + tail_count
             message = (f"... (content truncated: showing ~{num_shown_lines} lines "
@@ -133,241 +165,436 @@ def safe_read_file(path: Path, max_size_bytes: int, max_lines: int, head_ratio:
             output_parts.append(message)
 
             if tail_count > 0 and len(lines_read_up_to_max) > head_count:
-                output_parts.append("".join(lines_read_up_to_max[-tail_count:]))
+                output_parts.extend(lines_read_up_to_max[-tail_count:])
 
-            return "".join(output_parts), True
+            return "".join(output_parts), None
         else:
-            return "".join(lines_read_up_to_max), False
+            return "".join(lines_read_up_to_max), None
 
     except Exception as e:
-        return f"(error reading file: {e})", False
+        return f"(error reading file: {e})", None
+
 
+# A run of blank (whitespace-only) lines, from the first newline to the last one in the run.
+# Matches the same spans as r'\n\s*\n' without letting \s* swallow newlines and backtrack.
+_BLANK_RUN_RE = re.compile(r'\n(?:[^\S\n]*\n)+')
 
 def clean_content(text: str) -> str:
     if not text:
         return ""
-    normalized_text = text.replace('\r\n', '\n').replace('\r', '\n')
-    return re.sub(r'\n\s*\n', '\n\n', normalized_text).strip()
-
-def find_todos_fixmes(file_path: Path, content: str) -> list[str]:
-    pattern = re.compile(r"^\s*([#;/\"<!\{\-\*\'\s]*)(TODO|FIXME|XXX|HACK|BUG)(?:[\s:]*)(.*)$", re.IGNORECASE | re.MULTILINE)
+    # safe_read_file() output is already '\r'-free, so this usually skips two full copies
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    if text.count('\n') < 2: # A blank run needs two newlines
+        return text.strip()
+    return _BLANK_RUN_RE.sub('\n\n', text).strip()
+
+# Patterns used per scanned file, compiled once
+# Runs over a whole file at once, so whitespace is spelled [^\S\n] to keep every match on one line
+_TODO_PATTERN = r"^(?:[#;/\"<!\{\-\*\']|[^\S\n])*(?P<tag>TODO|FIXME|XXX|HACK|BUG)(?:[^\S\n]|:)*(?P<message>.*)$"
+_TODO_RE = re.compile(_TODO_PATTERN, re.IGNORECASE | re.MULTILINE)
+_TODO_TAGS = ("TODO", "FIXME", "XXX", "HACK", "BUG")
+# Line boundaries recognized by str.splitlines() other than '\n'
+_OTHER_LINE_BREAKS_RE = re.compile('[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+_GRADLE_DEP_RE = re.compile(r"^\s*(?:implementation|api|compileOnly|runtimeOnly|testImplementation)\s*[\(]?\s*['\"]([^:'\"]+:[^:'\"]+:[^:'\"]+)['\"]\s*[\)]?", re.IGNORECASE)
+# The Gradle rule in the same one-line form, fused with the TODO rule so a build.gradle is scanned once
+_GRADLE_DEP_LINE_PATTERN = r"^[^\S\n]*(?:implementation|api|compileOnly|runtimeOnly|testImplementation)[^\S\n]*[\(]?[^\S\n]*['\"](?P<coords>[^:'\"\n]+:[^:'\"\n]+:[^:'\"\n]+)['\"]"
+_TODO_OR_GRADLE_DEP_RE = re.compile(f"(?P<todo>{_TODO_PATTERN})|(?P<dep>{_GRADLE_DEP_LINE_PATTERN})", re.IGNORECASE | re.MULTILINE)
+
+def _with_newline_breaks(content: str) -> str:
+    """Return content with '\n' as its only line break, so regex line numbers agree with splitlines()."""
+    if _OTHER_LINE_BREAKS_RE.search(content):
+        return "\n".join(content.splitlines()) # Rare
+    return content
+
+def find_todos_fixmes(relative_file_path: str, content: str) -> list[str]:
+    # Most files have no tag at all; substring search is far cheaper than running the regex.
+    # Only trusted for ASCII text, where upper() folds case exactly as re.IGNORECASE does
+    if content.isascii():
+        content_upper = content.upper()
+        if not any(tag in content_upper for tag in _TODO_TAGS):
+            return []
+    content = _with_newline_breaks(content)
     matches = []
-    lines = content.splitlines()
-    for i, line_text in enumerate(lines):
-        match = pattern.search(line_text)
-        if match:
-            tag = match.group(2).upper()
-            message = match.group(3).strip()
-            if message:
-                matches.append(f"{file_path.as_posix()}:{i+1}: {tag}: {message}")
+    line_no, line_pos = 1, 0
+    for match in _TODO_RE.finditer(content):
+        line_no += content.count('\n', line_pos, match.start())
+        line_pos = match.start()
+        tag = match.group('tag').upper()
+        message = match.group('message').strip()
+        if message:
+            matches.append(f"{relative_file_path}:{line_no}: {tag}: {message}")
     return matches
 
-def extract_dependencies(file_path: Path, content: str) -> list[str]:
+def find_todos_and_dependencies(relative_file_path: str, file_name: str, content: str) -> tuple[list[str], list[str]]:
+    """
+    find_todos_fixmes() and extract_dependencies() together. A build.gradle is scanned once
+    with the fused regex; other files take the two separate passes.
+    """
+    if file_name.lower() not in ('build.gradle', 'build.gradle.kts'):
+        return find_todos_fixmes(relative_file_path, content), extract_dependencies(file_name, content)
+
+    content = _with_newline_breaks(content)
+    todos, dependencies = [], []
+    line_no, line_pos = 1, 0
+    for match in _TODO_OR_GRADLE_DEP_RE.finditer(content):
+        if match.group('dep') is not None:
+            dependencies.append(f"Gradle: {match.group('coords')}")
+            continue
+        line_no += content.count('\n', line_pos, match.start())
+        line_pos = match.start()
+        tag = match.group('tag').upper()
+        message = match.group('message').strip()
+        if message:
+            todos.append(f"{relative_file_path}:{line_no}: {tag}: {message}")
+    return todos, dependencies
+
+def _parse_gradle_dependencies(file_name: str, content: str) -> list[str]:
     dependencies = []
-    filename = file_path.name.lower()
-    lines = content.splitlines()
-
-    if filename == 'build.gradle' or filename == 'build.gradle.kts':
-        pattern = re.compile(r"^\s*(?:implementation|api|compileOnly|runtimeOnly|testImplementation)\s*[\(]?\s*['\"]([^:'\"]+:[^:'\"]+:[^:'\"]+)['\"]\s*[\)]?", re.IGNORECASE)
-        for line in lines:
-            match = pattern.search(line)
-            if match:
-                dependencies.append(f"Gradle: {match.group(1)}")
-    elif filename == 'pom.xml':
-        group_id, artifact_id, version = None, None, None
-        for line in lines:
-            if "<groupId>" in line and "</groupId>" in line:
-                group_id = line.split("<groupId>")[1].split("</groupId>")[0].strip()
-            elif "<artifactId>" in line and "</artifactId>" in line:
-                artifact_id = line.split("<artifactId>")[1].split("</artifactId>")[0].strip()
-            elif "<version>" in line and "</version>" in line:
-                version_match = re.search(r"<version>(.*?)</version>", line)
-                if version_match:
-                    version_text = version_match.group(1).strip()
-                    if not (version_text.startswith("${") and version_text.endswith("}")):
-                        version = version_text
-            if group_id and artifact_id and version:
+    for line in content.splitlines():
+        match = _GRADLE_DEP_RE.search(line)
+        if match:
+            dependencies.append(f"Gradle: {match.group(1)}")
+    return dependencies
+
+def _parse_pom_dependencies(file_name: str, content: str) -> list[str]:
+    dependencies = []
+    # Content may be truncated, so parse incrementally and keep whatever was read before any error
+    try:
+        for _, element in ET.iterparse(io.StringIO(content), events=('end',)):
+            if element.tag != 'dependency' and not element.tag.endswith('}dependency'):
+                continue
+            group_id = (element.findtext('{*}groupId') or '').strip()
+            artifact_id = (element.findtext('{*}artifactId') or '').strip()
+            version = (element.findtext('{*}version') or '').strip()
+            if group_id and artifact_id and version and not (version.startswith("${") and version.endswith("}")):
                 dependencies.append(f"Maven: {group_id}:{artifact_id}:{version}")
-                group_id, artifact_id, version = None, None, None
-            elif "</dependency>" in line:
-                group_id, artifact_id, version = None, None, None
-    elif filename == 'package.json':
-        try:
-            import json
-            data = json.loads(content)
-            for dep_type in ['dependencies', 'devDependencies', 'peerDependencies']:
-                if dep_type in data:
-                    for pkg, ver in data[dep_type].items():
-                        dependencies.append(f"NPM ({dep_type}): {pkg}@{ver}")
-        except ImportError:
-            dependencies.append("Skipped package.json parsing (json module not found).")
-        except json.JSONDecodeError:
-            dependencies.append(f"Skipped package.json parsing (invalid JSON for {file_path.name} - possibly due to truncation).")
-    elif filename == 'requirements.txt':
-        for line in lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                dependencies.append(f"Python (pip): {line}")
+            element.clear()
+    except ET.ParseError:
+        pass
     return dependencies
 
-def should_include_content(file_path: Path, args: argparse.Namespace) -> bool:
-    name_lower = file_path.name.lower()
-    if name_lower in args.include_names or file_path.suffix.lower() in args.include_exts:
+def _parse_package_json_dependencies(file_name: str, content: str) -> list[str]:
+    dependencies = []
+    try:
+        import json
+        data = json.loads(content)
+        for dep_type in ['dependencies', 'devDependencies', 'peerDependencies']:
+            if dep_type in data:
+                for pkg, ver in data[dep_type].items():
+                    dependencies.append(f"NPM ({dep_type}): {pkg}@{ver}")
+    except ImportError:
+        dependencies.append("Skipped package.json parsing (json module not found).")
+    except json.JSONDecodeError:
+        dependencies.append(f"Skipped package.json parsing (invalid JSON for {file_name} - possibly due to truncation).")
+    return dependencies
+
+def _parse_requirements_dependencies(file_name: str, content: str) -> list[str]:
+    dependencies = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            dependencies.append(f"Python (pip): {line}")
+    return dependencies
+
+# Dependency parser per lower-cased file name; each one splits the content only if it needs lines
+_DEP_PARSERS = {
+    'build.gradle': _parse_gradle_dependencies,
+    'build.gradle.kts': _parse_gradle_dependencies,
+    'pom.xml': _parse_pom_dependencies,
+    'package.json': _parse_package_json_dependencies,
+    'requirements.txt': _parse_requirements_dependencies,
+}
+
+def extract_dependencies(file_name: str, content: str) -> list[str]:
+    parser = _DEP_PARSERS.get(file_name.lower())
+    if parser is None:
+        return []
+    return parser(file_name, content)
+
+def file_suffix(filename: str) -> str:
+    """Same result as PurePath(filename).suffix, without building a path object."""
+    i = filename.rfind('.')
+    if 0 < i < len(filename) - 1:
+        return filename[i:]
+    return ''
+
+@lru_cache(maxsize=256)
+def _ext_included(suffix: str, include_exts: frozenset[str]) -> bool:
+    """Memoized per raw suffix, so files sharing an extension skip the lower() and set lookup."""
+    return suffix.lower() in include_exts
+
+def compile_ignore_patterns(globs: list[str], patterns: list[str]) -> tuple[re.Pattern, ...]:
+    """
+    Compile ignore rules to match with fullmatch(): the globs (e.g. '*.pyc') folded into one
+    case-insensitive alternation, since --ignore-files names are lower-cased, then each user
+    regex on its own. User patterns are not folded in, since one with a global inline flag
+    like '(?i)' only compiles at the start of an expression.
+    """
+    compiled = [re.compile(pattern) for pattern in patterns]
+    if globs:
+        compiled.insert(0, re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs), re.IGNORECASE))
+    return tuple(compiled)
+
+@dataclass(slots=True)
+class ScanConfig:
+    """
+    Scan settings resolved once from the command line. The helpers called per entry read
+    these on every file, and slot attributes are cheaper to look up than a Namespace's dict.
+    """
+    project_name: str | None
+    project_summary: str | None
+    max_depth: int
+    max_file_size_kb: int
+    max_content_lines: int
+    io_workers: int
+    include_names: frozenset[str]
+    include_exts: frozenset[str]
+    ignore_dirs: frozenset[str]
+    ignore_files: frozenset[str] # Literal names; globs are compiled into ignore_file_res
+    ignore_file_res: tuple[re.Pattern, ...]
+    ignore_dir_res: tuple[re.Pattern, ...]
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "ScanConfig":
+        """
+        Lower-case the name and extension lists, split --ignore-files into literal names and
+        glob patterns (e.g. '*.pyc'), and compile the globs and the --ignore-*-patterns
+        regexes. Raises re.error for an invalid pattern.
+        """
+        ignore_files = {name.lower() for name in args.ignore_files} # scan_project* handled separately
+        globs = {name for name in ignore_files if any(c in name for c in "*?[")}
+        return cls(
+            project_name=args.project_name,
+            project_summary=args.project_summary,
+            max_depth=args.max_depth,
+            max_file_size_kb=args.max_file_size_kb,
+            max_content_lines=args.max_content_lines,
+            io_workers=args.io_workers,
+            include_names=frozenset(name.lower() for name in args.include_names),
+            include_exts=frozenset(ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in args.include_exts),
+            ignore_dirs=frozenset(name.lower() for name in args.ignore_dirs),
+            ignore_files=frozenset(ignore_files - globs),
+            ignore_file_res=compile_ignore_patterns(sorted(globs), args.ignore_file_patterns),
+            ignore_dir_res=compile_ignore_patterns([], args.ignore_dir_patterns),
+        )
+
+def should_include_content(filename: str, config: ScanConfig) -> bool:
+    name_lower = filename.lower()
+    if name_lower in config.include_names or _ext_included(file_suffix(filename), config.include_exts):
         return True
-    if 'dockerfile' in args.include_names and name_lower == 'dockerfile':
+    if 'dockerfile' in config.include_names and name_lower == 'dockerfile':
         return True
     return False
 
-def is_ignored(path: Path, args: argparse.Namespace) -> bool:
-    path_name = path.name
+def is_ignored_entry(entry: os.DirEntry, config: ScanConfig) -> bool:
+    path_name = entry.name
+
+    # DirEntry answers these from the cached directory listing; only symlinks need a stat
+    try:
+        is_file = entry.is_file()
+        is_dir = not is_file and entry.is_dir()
+    except OSError:
+        is_file = is_dir = False
 
-    if path.is_file():
+    if is_file:
         # *** NEW: Skip files starting with "scan_project" ***
         if path_name.startswith("scan_project"):
             return True
-        if path_name in args.ignore_files:
+        if path_name in config.ignore_files:
             return True
-        for pattern in args.ignore_file_patterns:
-            if re.match(pattern, path_name):
-                return True
-    elif path.is_dir(): # Check directory specific ignores
-        if path_name in args.ignore_dirs:
+        if config.ignore_file_res and any(p.fullmatch(path_name) for p in config.ignore_file_res):
+            return True
+    elif is_dir: # Check directory specific ignores
+        if path_name in config.ignore_dirs:
+            return True
+        if config.ignore_dir_res and any(p.fullmatch(path_name) for p in config.ignore_dir_res):
             return True
-        for pattern in args.ignore_dir_patterns:
-            if re.match(pattern, path_name):
-                return True
     return False
 
-# --- Main Scanning Logic ---
-def scan_project(project_path: Path, args: argparse.Namespace) -> str:
-    output_lines = []
-    project_files_structure = []
-    all_todos_fixmes = []
-    all_dependencies = []
-    processed_files_for_content = set()
-
-    max_bytes = args.max_file_size_kb * 1024
-
-    output_lines.append("## LLM INSTRUCTIONS ##")
-    output_lines.append("You are an AI assistant. This file provides a snapshot of a software project.")
-    output_lines.append("Your primary goal is to understand the project's current state, identify potential issues or areas for improvement, and suggest concrete next steps.")
-    output_lines.append("Consider the project structure, key file contents (which may be truncated using a head/tail snippet approach for longer files), dependencies, and any TODO/FIXME comments.")
-    output_lines.append("Suggest actions such as refactoring, adding features, improving documentation, addressing potential bugs, or enhancing security based on the provided context.")
-    output_lines.append("Focus on providing actionable and specific recommendations. If information seems missing, you can state what would be helpful to know.")
-    output_lines.append("-" * 30)
-    output_lines.append("")
-
-    project_name = args.project_name if args.project_name else project_path.name
-    output_lines.append("## PROJECT OVERVIEW ##")
-    output_lines.append(f"Project Name: {project_name}")
-    output_lines.append(f"Project Root: {project_path.resolve().as_posix()}")
-    output_lines.append(f"Scan Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}")
-    if args.project_summary:
-        output_lines.append(f"Project Summary: {args.project_summary}")
-    else:
-        output_lines.append("Project Summary: [No summary provided. LLM should infer purpose from content or ask for clarification.]")
-    output_lines.append("-" * 30)
-    output_lines.append("")
-
-    output_lines.append("## PROJECT STRUCTURE, CONTENT & HIGHLIGHTS ##")
-    output_lines.append("Note: File content may be truncated for brevity (by size or line count). Paths are relative to project root.")
-    output_lines.append("For files truncated by line count, a snippet showing the approximate head and tail of the allowed lines is provided.")
-    output_lines.append("")
-
-    for root, dirs, files in os.walk(project_path, topdown=True):
-        current_path = Path(root)
-        relative_path = current_path.relative_to(project_path)
-
-        # Directory filtering must happen before depth check for dirs
-        # Filter ignored directories before further processing
-        dirs[:] = [d_name for d_name in dirs if not is_ignored(current_path / d_name, args)]
-        dirs.sort()
-
+def walk_project(dir_path: str, relative_path: str, depth: int, config: ScanConfig
+                 ) -> Iterator[tuple[str, int, list[os.DirEntry] | None, list[os.DirEntry]]]:
+    """
+    Depth-first walk over os.scandir, visiting directories in the same order as
+    os.walk(topdown=True) with sorted, filtered `dirs`.
+    Yields (relative_path, depth, dirs, files) per directory, with entries sorted by name and
+    ignored subdirectories removed. Directories deeper than `config.max_depth` are not listed;
+    they are yielded once with `dirs` set to None.
+    """
+    if depth > config.max_depth:
+        yield relative_path, depth, None, []
+        return
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
 
-        depth = len(relative_path.parts)
-        if depth > args.max_depth:
-            project_files_structure.append(f"{'  ' * depth}Halting scan at depth {depth} for {relative_path.as_posix()} (and its subdirectories)")
-            dirs[:] = [] # Prune descent into subdirectories of this too-deep directory
-            continue
+    dirs, files = [], []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        elif not is_ignored_entry(entry, config):
+            dirs.append(entry)
 
+    yield relative_path, depth, dirs, files
 
-        files.sort()
+    for entry in dirs:
+        if not entry.is_symlink(): # Like os.walk, never descend into symlinked directories
+            child_path = entry.name if relative_path == '.' else f"{relative_path}/{entry.name}"
+            yield from walk_project(entry.path, child_path, depth + 1, config)
 
-        level_prefix = '  ' * depth
-        if relative_path == Path("."):
-            project_files_structure.append(f"Project Root: {project_name}/")
-        else:
-            project_files_structure.append(f"{level_prefix}Directory: {relative_path.as_posix()}/")
+# --- Main Scanning Logic ---
+def scan_project(project_path: Path, config: ScanConfig, out: BinaryIO) -> None:
+    """
+    Writes the project context to `out` line by line while walking the project.
+    Only the dependency and TODO/FIXME sections, which come after the structure, are buffered.
+    """
+    def emit(line: str) -> None:
+        out.write(line.encode('utf-8'))
+        out.write(b"\n")
 
-        scannable_items_in_dir = 0
-        for filename in files:
-            file_path = current_path / filename
+    all_todos_fixmes = []
+    all_dependencies = []
+    processed_files_for_content = set()
 
-            # File ignoring check
-            if is_ignored(file_path, args):
-                project_files_structure.append(f"{level_prefix}  - {filename} (ignored)")
+    max_bytes = config.max_file_size_kb * 1024
+
+    emit("## LLM INSTRUCTIONS ##")
+    emit("You are an AI assistant. This file provides a snapshot of a software project.")
+    emit("Your primary goal is to understand the project's current state, identify potential issues or areas for improvement, and suggest concrete next steps.")
+    emit("Consider the project structure, key file contents (which may be truncated using a head/tail snippet approach for longer files), dependencies, and any TODO/FIXME comments.")
+    emit("Suggest actions such as refactoring, adding features, improving documentation, addressing potential bugs, or enhancing security based on the provided context.")
+    emit("Focus on providing actionable and specific recommendations. If information seems missing, you can state what would be helpful to know.")
+    emit("-" * 30)
+    emit("")
+
+    project_name = config.project_name if config.project_name else project_path.name
+    emit("## PROJECT OVERVIEW ##")
+    emit(f"Project Name: {project_name}")
+    emit(f"Project Root: {project_path.resolve().as_posix()}")
+    emit(f"Scan Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    if config.project_summary:
+        emit(f"Project Summary: {config.project_summary}")
+    else:
+        emit("Project Summary: [No summary provided. LLM should infer purpose from content or ask for clarification.]")
+    emit("-" * 30)
+    emit("")
+
+    emit("## PROJECT STRUCTURE, CONTENT & HIGHLIGHTS ##")
+    emit("Note: File content may be truncated for brevity (by size or line count). Paths are relative to project root.")
+    emit("For files truncated by line count, a snippet showing the approximate head and tail of the allowed lines is provided.")
+    emit("")
+
+    # Reads of a directory's included files are queued on the pool together so their I/O
+    # overlaps; the results are then consumed in listing order, keeping the output deterministic.
+    # With --io-workers 0 every read happens synchronously at submission instead.
+    # Indentation per depth, built once; the walk reports at most one level past max_depth
+    indents = ['  ' * i for i in range(max(config.max_depth, 0) + 2)]
+
+    read_pool = ThreadPoolExecutor(max_workers=config.io_workers) if config.io_workers > 0 else nullcontext()
+    with read_pool as executor:
+        for relative_dir, depth, dirs, files in walk_project(str(project_path), '.', 0, config):
+            if dirs is None:
+                emit(f"{indents[depth]}Halting scan at depth {depth} for {relative_dir} (and its subdirectories)")
                 continue
 
-            scannable_items_in_dir +=1
-            project_files_structure.append(f"{level_prefix}  - {filename}")
-            relative_file_path = file_path.relative_to(project_path)
-
-
-            if should_include_content(file_path, args) and file_path not in processed_files_for_content:
-                content, _ = safe_read_file(file_path, max_bytes, args.max_content_lines)
-                processed_files_for_content.add(file_path)
-
-                if content is not None:
-                    project_files_structure.append(f"{level_prefix}    ``` {file_path.suffix.lower() or 'text'}")
-                    project_files_structure.append(clean_content(content))
-                    project_files_structure.append(f"{level_prefix}    ```")
-
-                    todos = find_todos_fixmes(relative_file_path, content)
-                    if todos:
-                        all_todos_fixmes.extend(todos)
-
-                    deps = extract_dependencies(file_path, content)
-                    if deps:
-                        all_dependencies.extend(deps)
-                else:
-                    project_files_structure.append(f"{level_prefix}    (Could not read content or file is binary/empty)")
-
-        if not scannable_items_in_dir and not dirs: # if dirs is empty, it means either it was originally empty or all subdirs were ignored
-            project_files_structure.append(f"{level_prefix}  (No scannable files in this directory or directory is empty/fully ignored after filtering)")
-
-    output_lines.extend(project_files_structure)
-    output_lines.append("-" * 30)
-    output_lines.append("")
-
-    output_lines.append("## KEY DEPENDENCIES ##")
+            level_prefix = indents[depth]
+            entry_prefix = level_prefix + '  - '
+            if relative_dir == '.':
+                emit(f"Project Root: {project_name}/")
+            else:
+                emit(f"{level_prefix}Directory: {relative_dir}/")
+
+            file_items = [] # (filename, file_path or None if ignored, pending read or None)
+            for entry in files:
+                # File ignoring check
+                if is_ignored_entry(entry, config):
+                    file_items.append((entry.name, None, None))
+                    continue
+
+                file_path = entry.path
+                pending_read = None
+                if should_include_content(entry.name, config) and file_path not in processed_files_for_content:
+                    try:
+                        file_size = entry.stat().st_size
+                    except OSError:
+                        file_size = None # Let safe_read_file report the error
+                    if executor is not None and file_size != 0:
+                        pending_read = executor.submit(safe_read_file, file_path, max_bytes, config.max_content_lines,
+                                                       file_size=file_size)
+                    else: # Empty files resolve at once without opening them; no need for a pool round trip
+                        pending_read = Future()
+                        pending_read.set_result(safe_read_file(file_path, max_bytes, config.max_content_lines,
+                                                               file_size=file_size))
+                    processed_files_for_content.add(file_path)
+                file_items.append((entry.name, file_path, pending_read))
+
+            scannable_items_in_dir = 0
+            for filename, file_path, pending_read in file_items:
+                if file_path is None:
+                    emit(entry_prefix + filename + ' (ignored)')
+                    continue
+
+                scannable_items_in_dir +=1
+                emit(entry_prefix + filename)
+
+                if pending_read is not None:
+                    content, notice = pending_read.result()
+
+                    if content is not None:
+                        emit(f"{level_prefix}    ``` {file_suffix(filename).lower() or 'text'}")
+                        emit(clean_content(content))
+                        if notice:
+                            emit(notice)
+                        emit(f"{level_prefix}    ```")
+
+                        relative_file_path = filename if relative_dir == '.' else f"{relative_dir}/{filename}"
+                        todos, deps = find_todos_and_dependencies(relative_file_path, filename, content)
+                        if todos:
+                            all_todos_fixmes.extend(todos)
+                        if deps:
+                            all_dependencies.extend(deps)
+                    else:
+                        emit(f"{level_prefix}    (Could not read content or file is binary/empty)")
+
+            if not scannable_items_in_dir and not dirs: # if dirs is empty, it means either it was originally empty or all subdirs were ignored
+                emit(f"{level_prefix}  (No scannable files in this directory or directory is empty/fully ignored after filtering)")
+
+    emit("-" * 30)
+    emit("")
+
+    emit("## KEY DEPENDENCIES ##")
     if all_dependencies:
         unique_deps = sorted(list(set(all_dependencies)))
         for dep in unique_deps:
-            output_lines.append(f"- {dep}")
+            emit(f"- {dep}")
     else:
-        output_lines.append("No key dependencies automatically extracted or none found in recognized files (possibly due to content truncation).")
-    output_lines.append("-" * 30)
-    output_lines.append("")
+        emit("No key dependencies automatically extracted or none found in recognized files (possibly due to content truncation).")
+    emit("-" * 30)
+    emit("")
 
-    output_lines.append("## TODOs / FIXMEs ##")
+    emit("## TODOs / FIXMEs ##")
     if all_todos_fixmes:
         for item in all_todos_fixmes:
-            output_lines.append(f"- {item}")
+            emit(f"- {item}")
     else:
-        output_lines.append("No TODO, FIXME, XXX, HACK, or BUG comments found in scanned (and potentially truncated) file contents.")
-    output_lines.append("-" * 30)
-    output_lines.append("")
-
-    output_lines.append("## LLM PROMPT FOR NEXT STEPS ##")
-    output_lines.append("Based on the information provided above:")
-    output_lines.append("1. What is your overall understanding of this project's purpose and current state?")
-    output_lines.append("2. What are the 3-5 most critical next steps you would recommend for this project's development or improvement? Be specific.")
-    output_lines.append("3. Are there any potential issues, risks (e.g., missing error handling, security concerns, outdated dependencies from truncated files), or areas needing refactoring that stand out?")
-    output_lines.append("4. What additional information, if any, would help you provide a more comprehensive analysis?")
-    output_lines.append("Please provide your analysis and recommendations below.")
-    output_lines.append("## END OF PROJECT CONTEXT ##")
-
-    return "\n".join(output_lines)
+        emit("No TODO, FIXME, XXX, HACK, or BUG comments found in scanned (and potentially truncated) file contents.")
+    emit("-" * 30)
+    emit("")
+
+    emit("## LLM PROMPT FOR NEXT STEPS ##")
+    emit("Based on the information provided above:")
+    emit("1. What is your overall understanding of this project's purpose and current state?")
+    emit("2. What are the 3-5 most critical next steps you would recommend for this project's development or improvement? Be specific.")
+    emit("3. Are there any potential issues, risks (e.g., missing error handling, security concerns, outdated dependencies from truncated files), or areas needing refactoring that stand out?")
+    emit("4. What additional information, if any, would help you provide a more comprehensive analysis?")
+    emit("Please provide your analysis and recommendations below.")
+    out.write(b"## END OF PROJECT CONTEXT ##") # No trailing newline
 
 def main():
     parser = argparse.ArgumentParser(
@@ -420,6 +647,12 @@ def main():
         default=MAX_CONTENT_LINES_DEF,
         help=f"Maximum number of lines to include from a file's content (head/tail snippet if truncated). Default: {MAX_CONTENT_LINES_DEF}"
     )
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=READ_WORKERS,
+        help=f"Number of threads reading file contents concurrently; 0 reads files one at a time. Default: {READ_WORKERS}"
+    )
     parser.add_argument(
         "--include-names",
         type=str,
@@ -453,22 +686,23 @@ def main():
         type=str,
         nargs='*',
         default=[],
-        help="Custom regex patterns for directory names to ignore (e.g., '.*_cache')."
+        help="Custom regex patterns for directory names to ignore, matched against the whole name (e.g., '.*_cache')."
     )
     parser.add_argument(
         "--ignore-file-patterns",
         type=str,
         nargs='*',
         default=[],
-        help="Custom regex patterns for file names to ignore (e.g., 'temp_.*\\.log'). Note: 'scan_project*' is handled automatically."
+        help="Custom regex patterns for file names to ignore, matched against the whole name (e.g., 'temp_.*\\.log'). Note: 'scan_project*' is handled automatically."
     )
 
     args = parser.parse_args()
 
-    args.include_names = {name.lower() for name in args.include_names}
-    args.include_exts = {ext.lower() if ext.startswith('.') else '.' + ext.lower() for ext in args.include_exts}
-    args.ignore_dirs = {name.lower() for name in args.ignore_dirs}
-    args.ignore_files = {name.lower() for name in args.ignore_files} # scan_project* handled separately
+    try:
+        config = ScanConfig.from_args(args)
+    except re.error as e:
+        print(f"Error: Invalid ignore pattern '{e.pattern}': {e}", file=sys.stderr)
+        sys.exit(1)
 
     project_path = Path(args.project_path)
     if not project_path.is_dir():
@@ -482,10 +716,9 @@ def main():
 
 
     try:
-        project_context = scan_project(project_path, args)
         output_file_path = Path(args.output_file)
-        with output_file_path.open('w', encoding='utf-8') as f:
-            f.write(project_context)
+        with output_file_path.open('wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+            scan_project(project_path, config, f)
         print(f"Project context successfully generated: {output_file_path.resolve()}")
     except Exception as e:
         print(f"An error occurred during scanning: {e}", file=sys.stderr)